@@ -1,10 +1,15 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 import speech_recognition as sr
 import threading
 import json
 from datetime import datetime
 import platform
+from question_import import QuestionCatalog, QuestionFileChangedError
+
+# Number of imported questions shown per preview page on the setup screen
+PREVIEW_PAGE_SIZE = 20
+ALL_QUESTIONS_FILTER = "All questions"
 
 # Try to import appropriate TTS for the platform
 TTS_ENGINE = None
@@ -84,12 +89,21 @@ class AIInterviewer:
         
         # Interview state
         self.questions = []
+        self.current_question = ""
         self.current_question_index = 0
         self.answers = []
         self.is_listening = False
         self.interview_started = False
         self.setup_mode = True  # Start in setup mode
         
+        # Imported question catalogue (None means use the text box)
+        self.question_catalog = None
+        self.filtered_questions = None
+        self.import_summary = ""
+        self.preview_page = 0
+        self.question_filter = ALL_QUESTIONS_FILTER
+        self.clear_btn = None
+        
         self.setup_ui()
     
     def show_tts_warning(self, error_msg):
@@ -174,9 +188,18 @@ class AIInterviewer:
     
     def show_setup_screen(self):
         """Show the question setup screen"""
+        if self.question_catalog is not None:
+            # Drop a stale import before building widgets that would preview it
+            try:
+                self.question_catalog.check()
+            except QuestionFileChangedError as e:
+                self.on_question_file_changed(str(e))  # Redraws without the import
+                return
+        
         # Clear content frame
         for widget in self.content_frame.winfo_children():
             widget.destroy()
+        self.clear_btn = None
         
         # Setup container
         setup_container = tk.Frame(self.content_frame, bg=self.colors['white'])
@@ -192,9 +215,14 @@ class AIInterviewer:
         )
         instruction_label.pack(pady=20)
         
+        if self.question_catalog is not None:
+            subtitle = "Read-only preview of your imported questions. Click ✕ to type questions instead."
+        else:
+            subtitle = "Enter one question per line. The AI will ask them one by one."
+        
         subtitle_label = tk.Label(
             setup_container,
-            text="Enter one question per line. The AI will ask them one by one.",
+            text=subtitle,
             font=("Segoe UI", 11),
             bg=self.colors['white'],
             fg=self.colors['text_light']
@@ -227,17 +255,52 @@ class AIInterviewer:
         self.questions_text.pack(side='left', fill='both', expand=True)
         scrollbar.config(command=self.questions_text.yview)
         
-        # Sample questions
-        sample_questions = """Tell me about yourself.
+        # Import controls
+        import_frame = tk.Frame(setup_container, bg=self.colors['white'])
+        import_frame.pack(fill='x', padx=40)
+        
+        self.import_btn = ModernButton(
+            import_frame,
+            text="📂 Import File",
+            command=self.import_questions,
+            font=("Segoe UI", 10, "bold"),
+            bg=self.colors['secondary'],
+            fg='white',
+            activebackground='#00A383',
+            activeforeground='white',
+            padx=12,
+            pady=6,
+            relief='flat',
+            cursor="hand2",
+            borderwidth=0
+        )
+        self.import_btn.pack(side='left')
+        
+        self.import_info_label = tk.Label(
+            import_frame,
+            text="CSV, JSON Lines or text file",
+            font=("Segoe UI", 10),
+            bg=self.colors['white'],
+            fg=self.colors['text_light']
+        )
+        self.import_info_label.pack(side='left', padx=10)
+        
+        if self.question_catalog is not None:
+            self.create_preview_controls(import_frame)
+            if not self.show_preview_page():
+                return  # The screen was redrawn without the import
+        else:
+            # Sample questions
+            sample_questions = """Tell me about yourself.
 What are your key strengths?
 Describe a challenging project you worked on.
 Where do you see yourself in 5 years?
 Why do you want to work with us?"""
-        self.questions_text.insert("1.0", sample_questions)
+            self.questions_text.insert("1.0", sample_questions)
         
         # Start button - Now clearly visible
         start_btn_container = tk.Frame(setup_container, bg=self.colors['white'])
-        start_btn_container.pack(pady=30)
+        start_btn_container.pack(pady=20)
         
         self.start_btn = ModernButton(
             start_btn_container,
@@ -256,6 +319,236 @@ Why do you want to work with us?"""
         )
         self.start_btn.pack()
     
+    def create_preview_controls(self, parent):
+        """Create paging and filter controls for an imported catalogue"""
+        self.clear_btn = ModernButton(
+            parent,
+            text="✕",
+            command=self.clear_imported_questions,
+            font=("Segoe UI", 10, "bold"),
+            bg=self.colors['danger'],
+            fg='white',
+            activebackground='#FF6B6B',
+            activeforeground='white',
+            padx=10,
+            pady=6,
+            relief='flat',
+            cursor="hand2",
+            borderwidth=0
+        )
+        self.clear_btn.pack(side='right')
+        
+        self.next_page_btn = ModernButton(
+            parent,
+            text="→",
+            command=lambda: self.change_preview_page(1),
+            font=("Segoe UI", 10, "bold"),
+            bg=self.colors['light'],
+            fg=self.colors['text_dark'],
+            activebackground='#C8D1D5',
+            activeforeground=self.colors['text_dark'],
+            padx=10,
+            pady=6,
+            relief='flat',
+            cursor="hand2",
+            borderwidth=0
+        )
+        self.next_page_btn.pack(side='right', padx=(0, 8))
+        
+        self.page_label = tk.Label(
+            parent,
+            text="",
+            font=("Segoe UI", 10),
+            bg=self.colors['white'],
+            fg=self.colors['text_light']
+        )
+        self.page_label.pack(side='right', padx=4)
+        
+        self.prev_page_btn = ModernButton(
+            parent,
+            text="←",
+            command=lambda: self.change_preview_page(-1),
+            font=("Segoe UI", 10, "bold"),
+            bg=self.colors['light'],
+            fg=self.colors['text_dark'],
+            activebackground='#C8D1D5',
+            activeforeground=self.colors['text_dark'],
+            padx=10,
+            pady=6,
+            relief='flat',
+            cursor="hand2",
+            borderwidth=0
+        )
+        self.prev_page_btn.pack(side='right')
+        
+        # Company / category filter
+        filters = [ALL_QUESTIONS_FILTER]
+        for field in ("company", "category"):
+            filters += [f"{field.title()}: {value}"
+                        for value in self.question_catalog.tag_values(field)]
+        
+        self.filter_combo = ttk.Combobox(
+            parent,
+            values=filters,
+            state='readonly',
+            width=22,
+            font=("Segoe UI", 10)
+        )
+        self.filter_combo.set(self.question_filter if self.question_filter in filters
+                              else ALL_QUESTIONS_FILTER)
+        self.filter_combo.bind("<<ComboboxSelected>>", self.on_filter_selected)
+        self.filter_combo.pack(side='right', padx=10)
+    
+    def import_questions(self):
+        """Stream-import questions from a file in the background"""
+        path = filedialog.askopenfilename(
+            title="Import Interview Questions",
+            filetypes=[
+                ("Question files", "*.csv *.jsonl *.ndjson *.txt"),
+                ("All files", "*.*")
+            ]
+        )
+        if not path:
+            return
+        
+        self.set_import_running(True)
+        self.import_info_label.config(text="Reading questions...", fg=self.colors['accent'])
+        
+        def _show_progress(added):
+            if self.import_info_label.winfo_exists():
+                self.import_info_label.config(text=f"Reading questions... {added:,}")
+        
+        def _import():
+            try:
+                catalog = QuestionCatalog()
+                result = catalog.import_file(path, progress=lambda r: self.root.after(
+                    0, lambda added=r.added: _show_progress(added)
+                ))
+                self.root.after(0, lambda: self.on_questions_imported(catalog, result))
+            except Exception as e:
+                error_msg = str(e)
+                self.root.after(0, lambda msg=error_msg: self.on_import_failed(msg))
+        
+        thread = threading.Thread(target=_import)
+        thread.start()
+    
+    def set_import_running(self, running):
+        """Lock the setup screen controls while an import runs"""
+        state = "disabled" if running else "normal"
+        for button in (self.import_btn, self.start_btn, self.clear_btn):
+            if button is not None and button.winfo_exists():
+                button.config(state=state)
+        if self.import_btn.winfo_exists():
+            self.import_btn.config(text="⚙️ Importing..." if running else "📂 Import File")
+    
+    def on_questions_imported(self, catalog, result):
+        """Switch the setup screen to a paged preview of the import"""
+        if not len(catalog):
+            catalog.close()
+            self.on_import_failed("No questions were found in the file.")
+            return
+        
+        if self.question_catalog is not None:
+            self.question_catalog.close()
+        self.question_catalog = catalog
+        self.filtered_questions = catalog
+        self.import_summary = (
+            f"✅ {result.added:,} questions imported, "
+            f"{result.duplicates:,} duplicates skipped"
+        )
+        self.preview_page = 0
+        self.question_filter = ALL_QUESTIONS_FILTER
+        # Don't tear down a running interview; the preview shows on return to setup
+        if not self.interview_started:
+            self.show_setup_screen()
+    
+    def on_import_failed(self, error_msg):
+        """Restore the setup screen controls after a failed import"""
+        self.set_import_running(False)
+        if self.import_info_label.winfo_exists():
+            self.import_info_label.config(text="CSV, JSON Lines or text file",
+                                          fg=self.colors['text_light'])
+        messagebox.showerror("Import Error", f"Could not import questions: {error_msg}")
+    
+    def on_question_file_changed(self, error_msg):
+        """Drop an import whose file changed on disk, keeping any answers"""
+        messagebox.showerror(
+            "Question File Changed",
+            f"{error_msg}\n\nPlease import the questions again."
+        )
+        self.drop_imported_questions()
+        if not self.interview_started:
+            self.show_setup_screen()
+        elif self.answers:
+            self.finish_interview()  # Saves answers, then resets
+        else:
+            self.reset_interview()
+    
+    def drop_imported_questions(self):
+        """Forget the imported catalogue without touching the screen"""
+        if self.question_catalog is not None:
+            self.question_catalog.close()
+        self.question_catalog = None
+        self.filtered_questions = None
+        self.import_summary = ""
+        self.preview_page = 0
+        self.question_filter = ALL_QUESTIONS_FILTER
+    
+    def clear_imported_questions(self):
+        """Drop the imported catalogue and go back to typed questions"""
+        self.drop_imported_questions()
+        self.show_setup_screen()
+    
+    def active_questions(self):
+        """Imported questions narrowed by the selected company / category"""
+        return self.filtered_questions
+    
+    def on_filter_selected(self, event=None):
+        self.question_filter = self.filter_combo.get()
+        # Build the filtered view once, not on every page change
+        if self.question_filter == ALL_QUESTIONS_FILTER:
+            self.filtered_questions = self.question_catalog
+        else:
+            field, value = self.question_filter.split(": ", 1)
+            self.filtered_questions = self.question_catalog.filter(**{field.lower(): value})
+        self.preview_page = 0
+        self.show_preview_page()
+    
+    def change_preview_page(self, step):
+        page_count = self.active_questions().page_count(PREVIEW_PAGE_SIZE)
+        self.preview_page = min(max(self.preview_page + step, 0), page_count - 1)
+        self.show_preview_page()
+    
+    def show_preview_page(self):
+        """Render one page of the imported questions into the text box
+
+        Returns False if the imported file changed and the setup screen was
+        redrawn without it.
+        """
+        questions = self.active_questions()
+        page_count = questions.page_count(PREVIEW_PAGE_SIZE)
+        start = self.preview_page * PREVIEW_PAGE_SIZE
+        
+        try:
+            page = questions.page(self.preview_page, PREVIEW_PAGE_SIZE)
+        except QuestionFileChangedError as e:
+            self.on_question_file_changed(str(e))
+            return False
+        lines = [f"{start + i + 1}. {q}" for i, q in enumerate(page)]
+        
+        self.questions_text.config(state="normal")
+        self.questions_text.delete("1.0", tk.END)
+        self.questions_text.insert("1.0", "\n".join(lines))
+        self.questions_text.config(state="disabled")
+        
+        self.import_info_label.config(text=self.import_summary, fg=self.colors['secondary'])
+        self.page_label.config(text=f"Page {self.preview_page + 1} of {page_count:,}")
+        self.prev_page_btn.config(state="normal" if self.preview_page > 0 else "disabled")
+        self.next_page_btn.config(
+            state="normal" if self.preview_page < page_count - 1 else "disabled"
+        )
+        return True
+    
     def show_interview_screen(self):
         """Show the interview screen with current question"""
         # Clear content frame
@@ -433,9 +726,18 @@ Why do you want to work with us?"""
     
     def start_interview(self):
         """Initialize and start the interview"""
-        # Get questions from text box
-        questions_input = self.questions_text.get("1.0", tk.END).strip()
-        self.questions = [q.strip() for q in questions_input.split('\n') if q.strip()]
+        if self.question_catalog is not None:
+            try:
+                self.question_catalog.check()
+            except QuestionFileChangedError as e:
+                self.on_question_file_changed(str(e))
+                return
+            # Imported questions are read from disk as they are asked
+            self.questions = self.active_questions()
+        else:
+            # Get questions from text box
+            questions_input = self.questions_text.get("1.0", tk.END).strip()
+            self.questions = [q.strip() for q in questions_input.split('\n') if q.strip()]
         
         if not self.questions:
             messagebox.showwarning("No Questions", "Please enter at least one question!")
@@ -456,7 +758,12 @@ Why do you want to work with us?"""
     def ask_current_question(self):
         """Ask the current question"""
         if self.current_question_index < len(self.questions):
-            question = self.questions[self.current_question_index]
+            try:
+                question = self.questions[self.current_question_index]
+            except QuestionFileChangedError as e:
+                self.on_question_file_changed(str(e))
+                return
+            self.current_question = question
             self.current_question_label.config(text=question)
             self.progress_label.config(
                 text=f"Question {self.current_question_index + 1} of {len(self.questions)}"
@@ -572,7 +879,7 @@ Why do you want to work with us?"""
         
         # Store answer
         self.answers.append({
-            "question": self.questions[self.current_question_index],
+            "question": self.current_question,
             "answer": answer,
             "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         })
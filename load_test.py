@@ -0,0 +1,547 @@
+"""Load generator for the AI Voice Interviewer.
+
+Spawns N simulated candidates that run through the same flow as
+AIInterviewer (ask question -> speak -> listen -> recognize -> record
+answer -> next question) against local stand-ins for the speech
+recognizer and TTS engine, so no microphone, network or Tk window is
+needed. Concurrency is ramped up level by level and each level reports
+throughput, p50/p95/p99 answer turnaround, recognition queue depth and
+resource use, so the saturation point of one machine can be found.
+
+The shared recognition queue is an assumed server deployment, not how
+AIInterviewer works today: the desktop app starts one thread per
+listen_to_answer and calls recognize_google directly, with no queue. The
+queue depth and saturation point therefore describe a service that serves
+many candidates from a fixed pool of --workers recognizers. They are not
+measurements of the existing app.
+
+What the stand-ins model:
+    recognizer  a pool of --workers processes fed from one shared queue.
+                "burn" (default) hashes the clip's samples and then spends
+                --realtime-factor CPU seconds per second of audio, like a
+                local decoder. "sphinx" runs the offline CMU Sphinx
+                recognizer on each clip (needs SpeechRecognition and
+                pocketsphinx). Either way the work is real, so turnaround
+                degrades when the machine's cores run out.
+    TTS         sleeps for the time pyttsx3 takes to say the text at the
+                rate AIInterviewer configures; it costs no CPU, because
+                speech output plays on the candidate's own machine.
+    candidate   sleeps for think time plus the length of the answer clip.
+                Clips are the .wav files in --audio-dir, or 16 kHz 16-bit
+                white noise of realistic answer lengths.
+
+Example:
+    python load_test.py --ramp 10,50,100,200,400 --workers 8 --time-scale 0.05
+    python load_test.py --audio-dir recordings/ --ramp 25,50,100
+"""
+import argparse
+import hashlib
+import json
+import math
+import os
+import queue
+import random
+import threading
+import time
+import wave
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from question_import import QuestionCatalog
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+DEFAULT_QUESTIONS = [
+    "Tell me about yourself.",
+    "What are your key strengths?",
+    "Describe a challenging project you worked on.",
+    "Where do you see yourself in 5 years?",
+    "Why do you want to work with us?",
+]
+
+# Matches phrase_time_limit used by AIInterviewer.listen_to_answer
+MAX_ANSWER_SECONDS = 60
+# pyttsx3 rate configured by AIInterviewer (words per minute)
+TTS_WORDS_PER_MINUTE = 150
+# Synthetic answers are 16 kHz, 16-bit mono PCM
+SYNTHETIC_SAMPLE_RATE = 16000
+SYNTHETIC_SAMPLE_WIDTH = 2
+
+
+class AudioClip:
+    """A recorded or synthetic candidate answer"""
+    def __init__(self, name, duration, frames=b"", sample_rate=16000, sample_width=2):
+        self.name = name
+        self.duration = duration
+        self.frames = frames
+        self.sample_rate = sample_rate
+        self.sample_width = sample_width
+
+
+def load_audio_clips(audio_dir):
+    """Load every .wav file in a directory as a replayable answer"""
+    clips = []
+    for filename in sorted(os.listdir(audio_dir)):
+        if not filename.lower().endswith(".wav"):
+            continue
+        path = os.path.join(audio_dir, filename)
+        with wave.open(path, "rb") as wav:
+            # Trim to the longest answer AIInterviewer would record
+            sample_rate = wav.getframerate()
+            frame_count = min(wav.getnframes(), MAX_ANSWER_SECONDS * sample_rate)
+            frames = wav.readframes(frame_count)
+            clips.append(AudioClip(filename, frame_count / float(sample_rate), frames,
+                                   sample_rate, wav.getsampwidth()))
+    return clips
+
+
+def synthetic_audio_clips(count, rng):
+    """Generate white-noise PCM answers with realistic spoken-answer lengths"""
+    clips = []
+    for i in range(count):
+        duration = min(rng.lognormvariate(3.0, 0.5), MAX_ANSWER_SECONDS)
+        frame_count = int(duration * SYNTHETIC_SAMPLE_RATE)
+        frames = rng.randbytes(frame_count * SYNTHETIC_SAMPLE_WIDTH)
+        clips.append(AudioClip(f"synthetic_{i}", frame_count / float(SYNTHETIC_SAMPLE_RATE),
+                               frames, SYNTHETIC_SAMPLE_RATE, SYNTHETIC_SAMPLE_WIDTH))
+    return clips
+
+
+def _warm_up():
+    """Give the process pool a task so its workers start before timing"""
+    time.sleep(0.05)
+
+
+def _burn_recognize(name, frames, cpu_seconds):
+    """Hash the audio, then spend cpu_seconds of CPU like a local decoder
+
+    Returns the transcript and the wall time spent decoding.
+    """
+    started = time.perf_counter()
+    digest = hashlib.sha256(frames)
+    block = digest.digest() * 1024
+    deadline = time.process_time() + cpu_seconds
+    while time.process_time() < deadline:
+        digest.update(block)
+    return f"answer from {name} ({digest.hexdigest()[:8]})", time.perf_counter() - started
+
+
+def _sphinx_recognize(name, frames, sample_rate, sample_width):
+    """Transcribe the clip with the offline CMU Sphinx recognizer"""
+    import speech_recognition as sr
+    started = time.perf_counter()
+    audio = sr.AudioData(frames, sample_rate, sample_width)
+    try:
+        answer = sr.Recognizer().recognize_sphinx(audio)
+    except sr.UnknownValueError:
+        answer = ""
+    return answer, time.perf_counter() - started
+
+
+class StandInRecognizer:
+    """Local stand-in for Recognizer.recognize_google, run in worker processes"""
+    def __init__(self, mode, realtime_factor, time_scale, rng, workers):
+        self.mode = mode
+        self.realtime_factor = realtime_factor
+        self.time_scale = time_scale
+        self.rng = rng
+        self.lock = threading.Lock()
+        # Processes, not threads, so CPU-bound recognition isn't serialized by the GIL
+        self.executor = ProcessPoolExecutor(max_workers=workers)
+        for future in [self.executor.submit(_warm_up) for _ in range(workers)]:
+            future.result()
+
+    def recognize(self, clip):
+        """Transcribe a clip, returning (answer, decode wall seconds)"""
+        if self.mode == "sphinx":
+            future = self.executor.submit(_sphinx_recognize, clip.name, clip.frames,
+                                          clip.sample_rate, clip.sample_width)
+        else:
+            with self.lock:
+                jitter = self.rng.uniform(0.8, 1.2)
+            cpu_seconds = clip.duration * self.realtime_factor * jitter * self.time_scale
+            future = self.executor.submit(_burn_recognize, clip.name, clip.frames, cpu_seconds)
+        return future.result()
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+
+
+class StandInSpeaker:
+    """Local stand-in for SAPI / pyttsx3 speech output"""
+    def __init__(self, time_scale):
+        self.time_scale = time_scale
+
+    def speak(self, text):
+        seconds = len(text.split()) * 60.0 / TTS_WORDS_PER_MINUTE
+        time.sleep(seconds * self.time_scale)
+
+
+class RecognitionService:
+    """Fixed pool of recognizer workers fed from a shared queue
+
+    Models a server deployment; AIInterviewer itself has no such queue.
+    """
+    def __init__(self, recognizer, workers):
+        self.recognizer = recognizer
+        self.requests = queue.Queue()
+        self.threads = []
+        for _ in range(workers):
+            thread = threading.Thread(target=self._work, daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def _work(self):
+        while True:
+            clip, reply, enqueued = self.requests.get()
+            if clip is None:
+                break
+            waited = time.perf_counter() - enqueued
+            try:
+                answer, decode_seconds = self.recognizer.recognize(clip)
+                reply.put(((answer, waited + decode_seconds), None))
+            except Exception as e:
+                reply.put((None, e))
+
+    def recognize(self, clip):
+        """Submit a clip and block until its transcript is ready
+
+        Returns the answer and the modelled part of the turnaround (queue
+        wait plus decoding), which --time-scale compresses.
+        """
+        reply = queue.Queue(maxsize=1)
+        self.requests.put((clip, reply, time.perf_counter()))
+        result, error = reply.get()
+        if error is not None:
+            raise error
+        return result
+
+    def depth(self):
+        return self.requests.qsize()
+
+    def shutdown(self):
+        for _ in self.threads:
+            self.requests.put((None, None, None))
+        for thread in self.threads:
+            thread.join()
+        self.recognizer.close()
+
+
+class SimulatedCandidate:
+    """Drives one interview the way a human uses AIInterviewer"""
+    def __init__(self, candidate_id, questions, clips, service, speaker,
+                 think_time, time_scale, rng, questions_per_interview):
+        self.candidate_id = candidate_id
+        # Each candidate gets its own sample of the question pool
+        picked = rng.sample(range(len(questions)), min(questions_per_interview, len(questions)))
+        self.questions = [questions[i] for i in picked]
+        self.clips = clips
+        self.service = service
+        self.speaker = speaker
+        self.think_time = think_time
+        self.time_scale = time_scale
+        self.rng = rng
+        self.answers = []
+        self.turnarounds = []
+        self.overheads = []
+        self.errors = 0
+
+    def run(self):
+        for index, question in enumerate(self.questions):
+            # ask_current_question
+            self.speaker.speak(f"Question {index + 1}. {question}")
+
+            # Candidate thinks, then speaks the answer into the microphone
+            think_min, think_max = self.think_time
+            thinking = self.rng.uniform(think_min, think_max)
+            clip = self.rng.choice(self.clips)
+            time.sleep((thinking + clip.duration) * self.time_scale)
+
+            # listen_to_answer: turnaround is end of speech -> answer recorded
+            started = time.perf_counter()
+            try:
+                answer, modelled = self.service.recognize(clip)
+            except Exception:
+                self.errors += 1
+                continue
+            # Only queue wait and decoding are compressed by time_scale; thread
+            # and process hand-off overhead is real time and must not be scaled
+            overhead = max(time.perf_counter() - started - modelled, 0.0)
+            self.overheads.append(overhead)
+            self.turnarounds.append(modelled / self.time_scale + overhead)
+
+            # display_answer
+            self.answers.append({
+                "question": question,
+                "answer": answer,
+                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            })
+            self.speaker.speak("Thank you. I've recorded your answer.")
+
+
+class ResourceSampler:
+    """Samples queue depth and process resource use in the background"""
+    def __init__(self, service, interval):
+        self.service = service
+        self.interval = interval
+        self.depths = []
+        self.peak_threads = 0
+        self.peak_memory_mb = None
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self):
+        while not self.stop_event.is_set():
+            self.depths.append(self.service.depth())
+            self.peak_threads = max(self.peak_threads, threading.active_count())
+            memory = current_memory_mb()
+            if memory is not None:
+                self.peak_memory_mb = max(self.peak_memory_mb or 0.0, memory)
+            self.stop_event.wait(self.interval)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop_event.set()
+        self.thread.join()
+
+
+def cpu_seconds():
+    """CPU time of this process plus its reaped worker processes
+
+    Worker CPU is only counted once the pool has shut down, and child
+    times are not reported on Windows.
+    """
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of an unsorted list"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100.0 * len(ordered)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def _proc_rss_bytes(pid):
+    with open(f"/proc/{pid}/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def _proc_child_pids():
+    pids = []
+    for tid in os.listdir("/proc/self/task"):
+        with open(f"/proc/self/task/{tid}/children") as f:
+            pids += f.read().split()
+    return pids
+
+
+def current_memory_mb():
+    """Resident memory of this process and its workers in MB, if measurable"""
+    if psutil is not None:
+        process = psutil.Process()
+        total = 0
+        for proc in [process] + process.children(recursive=True):
+            try:
+                total += proc.memory_info().rss
+            except psutil.NoSuchProcess:
+                pass
+        return total / (1024 * 1024)
+    try:
+        # Linux without psutil
+        total = _proc_rss_bytes("self")
+        for pid in _proc_child_pids():
+            try:
+                total += _proc_rss_bytes(pid)
+            except OSError:
+                pass
+        return total / (1024 * 1024)
+    except OSError:
+        return None
+
+
+def run_level(concurrency, args, questions, clips, rng):
+    """Run one ramp level and return its metrics"""
+    recognizer = StandInRecognizer(args.recognizer, args.realtime_factor, args.time_scale,
+                                   rng, args.workers)
+    speaker = StandInSpeaker(args.time_scale)
+    service = RecognitionService(recognizer, args.workers)
+
+    candidates = [
+        SimulatedCandidate(
+            i, questions, clips, service, speaker,
+            (args.think_min, args.think_max), args.time_scale,
+            random.Random(rng.random()), args.questions_per_interview
+        )
+        for i in range(concurrency)
+    ]
+
+    cpu_start = cpu_seconds()
+    with ResourceSampler(service, args.sample_interval) as sampler:
+        started = time.perf_counter()
+        threads = []
+        for candidate in candidates:
+            thread = threading.Thread(target=candidate.run, daemon=True)
+            thread.start()
+            threads.append(thread)
+            # Stagger arrivals so candidates don't all answer in lockstep
+            time.sleep(args.spawn_interval * args.time_scale)
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+    service.shutdown()
+    cpu_used = cpu_seconds() - cpu_start
+
+    turnarounds = [t for c in candidates for t in c.turnarounds]
+    overheads = [o for c in candidates for o in c.overheads]
+    answered = sum(len(c.answers) for c in candidates)
+    # Report in unscaled (real interview) seconds
+    scale = 1.0 / args.time_scale
+    return {
+        "concurrency": concurrency,
+        "answers": answered,
+        "errors": sum(c.errors for c in candidates),
+        "throughput_per_min": answered / (elapsed * scale) * 60 if elapsed else 0.0,
+        "p50_s": percentile(turnarounds, 50),
+        "p95_s": percentile(turnarounds, 95),
+        "p99_s": percentile(turnarounds, 99),
+        "handoff_p95_ms": percentile(overheads, 95) * 1000,
+        "queue_depth_max": max(sampler.depths, default=0),
+        "queue_depth_mean": (sum(sampler.depths) / len(sampler.depths)
+                             if sampler.depths else 0.0),
+        # 100% is one fully busy core
+        "cpu_percent": cpu_used / elapsed * 100 if elapsed else 0.0,
+        # Peak RSS sampled during this level, worker processes included
+        "memory_mb": sampler.peak_memory_mb,
+        "peak_threads": sampler.peak_threads,
+    }
+
+
+def print_report(results, slo):
+    """Print a table of ramp levels and the detected saturation point"""
+    header = (f"{'N':>6} {'answers':>8} {'ans/min':>9} {'p50 s':>7} {'p95 s':>7} "
+              f"{'p99 s':>7} {'q max':>6} {'q mean':>7} {'cpu %':>6} {'peak MB':>8}")
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        memory = f"{r['memory_mb']:.0f}" if r["memory_mb"] is not None else "n/a"
+        print(f"{r['concurrency']:>6} {r['answers']:>8} {r['throughput_per_min']:>9.1f} "
+              f"{r['p50_s']:>7.2f} {r['p95_s']:>7.2f} {r['p99_s']:>7.2f} "
+              f"{r['queue_depth_max']:>6} {r['queue_depth_mean']:>7.1f} "
+              f"{r['cpu_percent']:>6.1f} {memory:>8}")
+
+    saturated = next((r for r in results if r["p95_s"] > slo), None)
+    if saturated:
+        print(f"\n⚠️ Saturation: p95 turnaround exceeded {slo:.1f}s "
+              f"at {saturated['concurrency']} concurrent candidates")
+    else:
+        print(f"\n✅ p95 turnaround stayed under {slo:.1f}s at every level")
+    return saturated
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate concurrent interview candidates")
+    parser.add_argument("--ramp", default="10,50,100,200",
+                        help="comma-separated concurrency levels (default: 10,50,100,200)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4,
+                        help="recognizer worker processes (default: CPU count)")
+    parser.add_argument("--questions-file",
+                        help="CSV, JSON Lines or text question file (default: sample questions)")
+    parser.add_argument("--questions-per-interview", type=int, default=5,
+                        help="questions each candidate is asked, sampled from the pool (default: 5)")
+    parser.add_argument("--audio-dir",
+                        help="directory of recorded .wav answers (default: synthetic audio)")
+    parser.add_argument("--think-min", type=float, default=2.0,
+                        help="minimum think time before answering, seconds")
+    parser.add_argument("--think-max", type=float, default=8.0,
+                        help="maximum think time before answering, seconds")
+    parser.add_argument("--recognizer", choices=("burn", "sphinx"), default="burn",
+                        help="stand-in recognition work (default: burn)")
+    parser.add_argument("--realtime-factor", type=float, default=0.1,
+                        help="burn: CPU seconds of recognition work per second of audio")
+    parser.add_argument("--spawn-interval", type=float, default=0.5,
+                        help="seconds between candidate arrivals")
+    parser.add_argument("--time-scale", type=float, default=1.0,
+                        help="multiply all simulated delays, e.g. 0.05 for a quick run; "
+                             "queue waits are scaled back up, so small scales "
+                             "exaggerate scheduling jitter")
+    parser.add_argument("--sample-interval", type=float, default=0.1,
+                        help="queue depth sampling interval, seconds")
+    parser.add_argument("--slo", type=float, default=5.0,
+                        help="p95 turnaround (seconds) treated as saturated")
+    parser.add_argument("--seed", type=int, default=None, help="random seed")
+    parser.add_argument("--output", help="write results JSON to this file")
+    args = parser.parse_args(argv)
+
+    if args.time_scale <= 0:
+        parser.error("--time-scale must be positive")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.questions_per_interview < 1:
+        parser.error("--questions-per-interview must be at least 1")
+    if args.think_min > args.think_max:
+        parser.error("--think-min must not exceed --think-max")
+    if args.recognizer == "sphinx":
+        if args.time_scale != 1.0:
+            parser.error("--recognizer sphinx runs in real time; --time-scale must be 1")
+        try:
+            import speech_recognition  # noqa: F401
+            import pocketsphinx  # noqa: F401
+        except ImportError:
+            parser.error("--recognizer sphinx needs: pip install SpeechRecognition pocketsphinx")
+    try:
+        args.ramp = [int(n) for n in args.ramp.split(",") if n.strip()]
+    except ValueError:
+        parser.error("--ramp must be comma-separated integers")
+    if not args.ramp or min(args.ramp) < 1:
+        parser.error("--ramp levels must be positive")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    rng = random.Random(args.seed)
+
+    questions = DEFAULT_QUESTIONS
+    if args.questions_file:
+        questions = QuestionCatalog.from_file(args.questions_file)
+
+    if args.audio_dir:
+        clips = load_audio_clips(args.audio_dir)
+        if not clips:
+            raise SystemExit(f"No .wav files found in {args.audio_dir}")
+    else:
+        clips = synthetic_audio_clips(50, rng)
+
+    print(f"🎙️ Load test: {len(questions)} questions, {len(clips)} clips, "
+          f"{args.workers} {args.recognizer} recognizer workers, ramp {args.ramp}\n")
+
+    results = []
+    for concurrency in args.ramp:
+        print(f"Running {concurrency} concurrent candidates...")
+        results.append(run_level(concurrency, args, questions, clips, rng))
+    print()
+    saturated = print_report(results, args.slo)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({
+                "test_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "workers": args.workers,
+                "slo_p95_s": args.slo,
+                "saturation_concurrency": saturated["concurrency"] if saturated else None,
+                "levels": results
+            }, f, indent=2)
+        print(f"📁 Results saved to: {os.path.abspath(args.output)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+"""Streaming bulk question import for the AI Voice Interviewer.
+
+Question files are parsed one line at a time, so large catalogues never
+have to be pasted into the setup screen's Text widget. Supported formats:
+
+    .csv            header row with a "question" column, plus optional
+                    "company" and "category" columns; without that header
+                    each whole line is one question
+    .jsonl/.ndjson  one object per line: {"question": ..., "company": ...,
+                    "category": ...}
+    anything else   plain text, one question per line
+
+Duplicates are dropped through an index of hashes of the normalized
+question text. QuestionCatalog only keeps the file offset and tags of
+each unique question in memory; the text itself is re-read from disk when
+a question is accessed, so the catalogue behaves like a lazily
+materialized list. Imported files must therefore stay unchanged; reading
+from one that was edited, moved or deleted raises QuestionFileChangedError.
+"""
+import csv
+import hashlib
+import json
+import os
+import re
+import threading
+
+TAG_FIELDS = ("company", "category")
+
+FORMAT_BY_EXTENSION = {
+    ".csv": "csv",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+}
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_question(text):
+    """Normalize question text for duplicate detection"""
+    text = _WHITESPACE.sub(" ", text).strip().casefold()
+    return text.rstrip("?.!").rstrip()
+
+
+def question_hash(text):
+    """Hash of the normalized text, used as the dedup index key"""
+    return hashlib.blake2b(normalize_question(text).encode("utf-8"), digest_size=16).digest()
+
+
+def detect_format(path):
+    """Guess the file format from its extension"""
+    extension = os.path.splitext(path)[1].lower()
+    return FORMAT_BY_EXTENSION.get(extension, "text")
+
+
+def _csv_columns(line):
+    """Column names from a CSV header line, or None if it is not a header"""
+    header = [c.strip().lower() for c in next(csv.reader([line]), [])]
+    return header if "question" in header else None
+
+
+def _parse_csv_line(line, columns):
+    row = next(csv.reader([line]), [])
+    if columns is None:
+        # No header row: the whole line is the question, unquoted if it is
+        # a single quoted field
+        return (row[0] if len(row) == 1 else line).strip(), {}
+    record = dict(zip(columns, row))
+    question = record.get("question", "")
+    tags = {field: record[field].strip() for field in TAG_FIELDS if record.get(field, "").strip()}
+    return question.strip(), tags
+
+
+def _parse_jsonl_line(line):
+    record = json.loads(line)
+    if isinstance(record, str):
+        return record.strip(), {}
+    question = str(record.get("question") or record.get("text") or "")
+    tags = {field: str(record[field]).strip() for field in TAG_FIELDS if record.get(field)}
+    return question.strip(), tags
+
+
+def _parse_line(line, file_format, columns):
+    """Parse one decoded line into (question, tags)"""
+    if file_format == "csv":
+        return _parse_csv_line(line, columns)
+    if file_format == "jsonl":
+        return _parse_jsonl_line(line)
+    return line.strip(), {}
+
+
+class QuestionFileReader:
+    """Streams (offset, question, tags) records from one question file
+
+    Malformed lines are skipped. CSV fields must not span lines. Once
+    iteration has started, columns holds the CSV header columns, or None
+    if the file has no "question" header.
+    """
+    def __init__(self, path, file_format=None):
+        self.path = path
+        self.file_format = file_format or detect_format(path)
+        self.columns = None
+
+    def __iter__(self):
+        offset = 0
+        first_line = True
+        with open(self.path, "rb") as f:
+            for raw in f:
+                line_offset = offset
+                offset += len(raw)
+                line = raw.decode("utf-8-sig" if line_offset == 0 else "utf-8", errors="replace")
+                if not line.strip():
+                    continue
+                if self.file_format == "csv" and first_line:
+                    first_line = False
+                    self.columns = _csv_columns(line)
+                    if self.columns is not None:
+                        continue
+                try:
+                    question, tags = _parse_line(line, self.file_format, self.columns)
+                except (ValueError, AttributeError):
+                    continue
+                if question:
+                    yield line_offset, question, tags
+
+
+def iter_question_records(path, file_format=None):
+    """Yield (offset, question, tags) for every parseable line of a file"""
+    return iter(QuestionFileReader(path, file_format))
+
+
+class QuestionFileChangedError(Exception):
+    """A question file was edited, moved or deleted after it was imported"""
+
+
+def _file_signature(path):
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+class ImportResult:
+    """Counts reported by a single QuestionCatalog.import_file call"""
+    def __init__(self, path):
+        self.path = path
+        self.added = 0
+        self.duplicates = 0
+
+    def __repr__(self):
+        return f"ImportResult(path={self.path!r}, added={self.added}, duplicates={self.duplicates})"
+
+
+class QuestionCatalog:
+    """Deduplicated, tagged, lazily materialized list of questions"""
+    def __init__(self):
+        self._sources = []          # (path, file_format, csv columns, signature)
+        self._entries = []          # (source index, offset, tags)
+        self._index = {}            # normalized text hash -> tags
+        self._wanted = frozenset()  # tags a filtered view requires
+        self._tag_pool = {}         # interned tag tuples
+        self._handles = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_file(cls, path, file_format=None, default_tags=None):
+        catalog = cls()
+        catalog.import_file(path, file_format, default_tags)
+        return catalog
+
+    def import_file(self, path, file_format=None, default_tags=None, progress=None):
+        """Stream a file into the catalogue, skipping duplicates
+
+        progress, if given, is called with the running ImportResult every
+        1000 questions.
+        """
+        reader = QuestionFileReader(path, file_format)
+        source = len(self._sources)
+        signature = _file_signature(path)
+        self._sources.append((path, reader.file_format, None, signature))
+
+        result = ImportResult(path)
+        for offset, question, tags in reader:
+            key = question_hash(question)
+            if key in self._index:
+                result.duplicates += 1
+                continue
+            merged = dict(default_tags or {})
+            merged.update(tags)
+            tags = self._intern_tags(merged)
+            self._index[key] = tags
+            self._entries.append((source, offset, tags))
+            result.added += 1
+            if progress and result.added % 1000 == 0:
+                progress(result)
+        # Re-read questions with the same columns the import detected
+        self._sources[source] = (path, reader.file_format, reader.columns, signature)
+        return result
+
+    def _intern_tags(self, tags):
+        key = tuple(sorted(tags.items()))
+        return self._tag_pool.setdefault(key, key)
+
+    def __contains__(self, question):
+        tags = self._index.get(question_hash(question))
+        return tags is not None and self._wanted <= set(tags)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return self._read(self._entries[index])[0]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def _check_source(self, source):
+        path, _, _, signature = self._sources[source]
+        try:
+            unchanged = _file_signature(path) == signature
+        except OSError:
+            raise QuestionFileChangedError(f"{path} was moved or deleted after it was imported")
+        if not unchanged:
+            raise QuestionFileChangedError(f"{path} was modified after it was imported")
+
+    def check(self):
+        """Raise QuestionFileChangedError if any imported file has changed"""
+        for source in range(len(self._sources)):
+            self._check_source(source)
+
+    def _read(self, entry):
+        """Re-read one question and its tags from disk"""
+        source, offset, tags = entry
+        path, file_format, columns, _ = self._sources[source]
+        self._check_source(source)
+        with self._lock:
+            handle = self._handles.get(source)
+            if handle is None:
+                handle = self._handles[source] = open(path, "rb")
+            handle.seek(offset)
+            raw = handle.readline()
+        line = raw.decode("utf-8-sig" if offset == 0 else "utf-8", errors="replace")
+        question, _ = _parse_line(line, file_format, columns)
+        return question, dict(tags)
+
+    def tags(self, index):
+        """Tags of the question at index, e.g. {"company": "Acme"}"""
+        return dict(self._entries[index][2])
+
+    def tag_values(self, field):
+        """Sorted distinct values of a tag field across the catalogue"""
+        return sorted({value for tags in self._tag_pool for name, value in tags if name == field})
+
+    def filter(self, **tags):
+        """New catalogue view holding only questions with matching tags"""
+        view = QuestionCatalog()
+        view._sources = self._sources
+        view._handles = self._handles
+        view._lock = self._lock
+        view._tag_pool = self._tag_pool
+        view._index = self._index
+        view._wanted = self._wanted | frozenset(tags.items())
+        added = set(tags.items())
+        view._entries = [e for e in self._entries if added <= set(e[2])]
+        return view
+
+    def page(self, page, page_size=20):
+        """Questions on a zero-based preview page"""
+        start = page * page_size
+        return self[start:start + page_size]
+
+    def page_count(self, page_size=20):
+        return max((len(self) + page_size - 1) // page_size, 1)
+
+    def close(self):
+        with self._lock:
+            for handle in self._handles.values():
+                handle.close()
+            self._handles.clear()
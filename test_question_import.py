@@ -0,0 +1,128 @@
+import json
+import os
+
+import pytest
+
+from question_import import (
+    QuestionCatalog,
+    QuestionFileChangedError,
+    iter_question_records,
+    normalize_question,
+)
+
+
+def write(tmp_path, name, text, encoding="utf-8"):
+    path = tmp_path / name
+    path.write_text(text, encoding=encoding)
+    return str(path)
+
+
+def test_normalize_question_ignores_case_spacing_and_trailing_punctuation():
+    assert normalize_question("  Why   US?! ") == normalize_question("why us")
+    assert normalize_question("Why us?") != normalize_question("Why them?")
+
+
+def test_plain_text_one_question_per_line(tmp_path):
+    path = write(tmp_path, "q.txt", "First question\n\n  Second question  \n")
+    assert list(QuestionCatalog.from_file(path)) == ["First question", "Second question"]
+
+
+def test_csv_with_header_reads_question_and_tags(tmp_path):
+    path = write(tmp_path, "q.csv",
+                 "Company,Question,Category\n"
+                 'Acme,"Tell me, about yourself?",behavioral\n'
+                 "Beta,Why us?,\n")
+    catalog = QuestionCatalog.from_file(path)
+    assert list(catalog) == ["Tell me, about yourself?", "Why us?"]
+    assert catalog.tags(0) == {"company": "Acme", "category": "behavioral"}
+    assert catalog.tags(1) == {"company": "Beta"}
+
+
+def test_csv_header_after_bom_and_blank_line(tmp_path):
+    path = write(tmp_path, "q.csv", "﻿\nquestion,company\nWhat?,Acme\n")
+    catalog = QuestionCatalog.from_file(path)
+    assert list(catalog) == ["What?"]
+    assert catalog.tags(0) == {"company": "Acme"}
+
+
+def test_csv_without_header_keeps_whole_line(tmp_path):
+    path = write(tmp_path, "q.csv", 'Only question, with comma\n"Quoted, single field"\n')
+    assert list(QuestionCatalog.from_file(path)) == [
+        "Only question, with comma",
+        "Quoted, single field",
+    ]
+
+
+def test_jsonl_skips_malformed_and_non_object_lines(tmp_path):
+    lines = [
+        json.dumps({"question": "Why us?", "company": "Acme"}),
+        "not json",
+        "[1, 2]",
+        "42",
+        json.dumps("Bare string question"),
+        json.dumps({"text": "Uses text key", "category": "fit"}),
+        json.dumps({"company": "Acme"}),
+    ]
+    path = write(tmp_path, "q.jsonl", "\n".join(lines) + "\n")
+    catalog = QuestionCatalog.from_file(path)
+    assert list(catalog) == ["Why us?", "Bare string question", "Uses text key"]
+    assert catalog.tags(2) == {"category": "fit"}
+
+
+def test_records_report_line_offsets(tmp_path):
+    path = write(tmp_path, "q.txt", "a\nbb\n")
+    assert [(offset, q) for offset, q, _ in iter_question_records(path)] == [(0, "a"), (2, "bb")]
+
+
+def test_dedup_within_and_across_files(tmp_path):
+    first = write(tmp_path, "a.txt", "Why us?\nwhy   US\nWhat else?\n")
+    second = write(tmp_path, "b.jsonl", json.dumps({"question": "WHAT ELSE"}) + "\n")
+    catalog = QuestionCatalog()
+    result = catalog.import_file(first)
+    assert (result.added, result.duplicates) == (2, 1)
+    result = catalog.import_file(second)
+    assert (result.added, result.duplicates) == (0, 1)
+    assert list(catalog) == ["Why us?", "What else?"]
+    assert "why us" in catalog
+    assert "Who?" not in catalog
+
+
+def test_default_tags_are_overridden_by_file_tags(tmp_path):
+    path = write(tmp_path, "q.csv", "question,company\nA?,Acme\nB?,\n")
+    catalog = QuestionCatalog.from_file(path, default_tags={"company": "Default", "category": "x"})
+    assert catalog.tags(0) == {"company": "Acme", "category": "x"}
+    assert catalog.tags(1) == {"company": "Default", "category": "x"}
+
+
+def test_filter_and_page(tmp_path):
+    rows = "".join(f"Question {i}?,{'Acme' if i % 2 else 'Beta'}\n" for i in range(45))
+    catalog = QuestionCatalog.from_file(write(tmp_path, "q.csv", "question,company\n" + rows))
+    assert catalog.tag_values("company") == ["Acme", "Beta"]
+    assert catalog.page_count(20) == 3
+    assert catalog.page(2, 20) == [f"Question {i}?" for i in range(40, 45)]
+
+    acme = catalog.filter(company="Acme")
+    assert len(acme) == 22
+    assert acme[0] == "Question 1?"
+    assert "Question 1" in acme
+    assert "Question 2" not in acme
+    assert len(acme.filter(company="Beta")) == 0
+
+
+def test_reading_a_changed_file_raises(tmp_path):
+    path = write(tmp_path, "q.txt", "First?\nSecond?\n")
+    catalog = QuestionCatalog.from_file(path)
+    assert catalog[1] == "Second?"
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("Third?\n")
+    with pytest.raises(QuestionFileChangedError):
+        catalog[0]
+
+
+def test_reading_a_deleted_file_raises(tmp_path):
+    path = write(tmp_path, "q.txt", "First?\n")
+    catalog = QuestionCatalog.from_file(path)
+    catalog.close()
+    os.remove(path)
+    with pytest.raises(QuestionFileChangedError):
+        catalog.check()